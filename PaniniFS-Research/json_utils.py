@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+JSON UTILS - SÉRIALISATION PARTAGÉE
+===================================
+Écriture JSON commune aux extracteurs, analyseurs et validateurs
+(orjson si disponible, json de la bibliothèque standard sinon)
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj) -> bytes:
+    """Sérialiser en JSON UTF-8 indenté (orjson si disponible)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
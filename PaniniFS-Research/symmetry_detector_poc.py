@@ -14,8 +14,10 @@ Conformité: ISO 8601, clarifications mission
 
 from datetime import datetime, timezone
 from typing import Any, List, Dict, Tuple, Optional
-import json
 import hashlib
+from pathlib import Path
+
+from json_utils import dumps_json
 
 
 class SymmetryPattern:
@@ -211,8 +213,7 @@ class SymmetryDetector:
             "symmetry_log": self.symmetry_log[-20:]  # Derniers 20 tests
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(dumps_json(results))
         
         print(f"\n💾 Résultats exportés: {filepath}")
         return filepath
@@ -11,8 +11,68 @@ Date: 2025-09-30
 
 from datetime import datetime, timezone
 import json
+import sys
 from typing import Dict, List
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from json_utils import dumps_json
+
+
+# Caractéristiques dérivées (bitmask par traducteur)
+FLAG_FRANCE = 1 << 0
+FLAG_SPAIN = 1 << 1
+FLAG_INDIA = 1 << 2
+FLAG_PRE2000 = 1 << 3
+FLAG_2000_2010 = 1 << 4
+FLAG_POST2010 = 1 << 5
+FLAG_FORMAL_HIGH = 1 << 6
+FLAG_FORMAL_MEDIUM = 1 << 7
+FLAG_SUB_HIGH = 1 << 8
+FLAG_SUB_LOW = 1 << 9
+
+
+def _features(ou: str, quand: str, style_markers: Dict) -> int:
+    """Calculer le bitmask des classifications géo/période/style"""
+    mask = 0
+    
+    if 'France' in ou or 'Paris' in ou:
+        mask |= FLAG_FRANCE
+    if 'Espagne' in ou or 'Madrid' in ou:
+        mask |= FLAG_SPAIN
+    if 'Inde' in ou or 'India' in ou:
+        mask |= FLAG_INDIA
+    
+    if '-' in quand:
+        start, end = quand.split('-')
+        start_year = int(start)
+        if start_year < 2000:
+            mask |= FLAG_PRE2000
+        elif start_year < 2010:
+            mask |= FLAG_2000_2010
+        else:
+            mask |= FLAG_POST2010
+    
+    formalisation = style_markers.get('formalisation', '')
+    if 'élevée' in formalisation or 'très' in formalisation:
+        mask |= FLAG_FORMAL_HIGH
+    elif 'moyenne' in formalisation:
+        mask |= FLAG_FORMAL_MEDIUM
+    
+    sub_ratio = style_markers.get('subordinations_complexes', 0)
+    if sub_ratio > 0.7:
+        mask |= FLAG_SUB_HIGH
+    elif sub_ratio < 0.5:
+        mask |= FLAG_SUB_LOW
+    
+    return mask
+
+
+def _intern_keys(markers: Dict) -> Dict:
+    """Copier un dict de marqueurs avec clés internées"""
+    return {sys.intern(k): v for k, v in (markers or {}).items()}
 
 
 class BiasPatternAnalyzer:
@@ -24,6 +84,17 @@ class BiasPatternAnalyzer:
         self.translators = data['traducteurs']
         self.patterns = defaultdict(list)
         
+        # Colonnes parallèles (SoA) partagées par tous les analyseurs
+        self._qui = [sys.intern(t['qui']) for t in self.translators]
+        self._ou = [t.get('ou') or '' for t in self.translators]
+        self._quand = [t.get('quand') or '' for t in self.translators]
+        self._biais = [_intern_keys(t.get('biais')) for t in self.translators]
+        self._style = [_intern_keys(t.get('style_markers')) for t in self.translators]
+        self._features = [
+            _features(ou, quand, style)
+            for ou, quand, style in zip(self._ou, self._quand, self._style)
+        ]
+        
     def analyze_cultural_bias_patterns(self) -> Dict:
         """Identifier patterns biais culturels récurrents"""
         print("\n🌍 ANALYSE BIAIS CULTURELS")
@@ -31,17 +102,13 @@ class BiasPatternAnalyzer:
         
         cultural_patterns = defaultdict(list)
         
-        for translator in self.translators:
-            qui = translator['qui']
-            ou = translator.get('ou', '')
-            biais = translator.get('biais', {})
-            
+        for qui, mask, biais in zip(self._qui, self._features, self._biais):
             # Extraire composantes géographiques/culturelles
-            if 'France' in ou or 'Paris' in ou:
+            if mask & FLAG_FRANCE:
                 cultural_patterns['Occidental/Français'].append(qui)
-            if 'Espagne' in ou or 'Madrid' in ou:
+            if mask & FLAG_SPAIN:
                 cultural_patterns['Occidental/Ibérique'].append(qui)
-            if 'Inde' in ou or 'India' in ou:
+            if mask & FLAG_INDIA:
                 cultural_patterns['Oriental/Indien'].append(qui)
             
             # Analyser types biais
@@ -63,22 +130,14 @@ class BiasPatternAnalyzer:
         
         temporal_patterns = defaultdict(list)
         
-        for translator in self.translators:
-            qui = translator['qui']
-            quand = translator.get('quand', '')
-            biais = translator.get('biais', {})
-            
+        for qui, mask, biais in zip(self._qui, self._features, self._biais):
             # Extraire période
-            if '-' in quand:
-                start, end = quand.split('-')
-                start_year = int(start)
-                
-                if start_year < 2000:
-                    temporal_patterns['Pré-2000'].append(qui)
-                elif start_year < 2010:
-                    temporal_patterns['2000-2010'].append(qui)
-                else:
-                    temporal_patterns['Post-2010'].append(qui)
+            if mask & FLAG_PRE2000:
+                temporal_patterns['Pré-2000'].append(qui)
+            elif mask & FLAG_2000_2010:
+                temporal_patterns['2000-2010'].append(qui)
+            elif mask & FLAG_POST2010:
+                temporal_patterns['Post-2010'].append(qui)
             
             # Analyser biais temporel spécifique
             temporal_bias = biais.get('temporel', '')
@@ -98,22 +157,17 @@ class BiasPatternAnalyzer:
         
         style_signatures = defaultdict(list)
         
-        for translator in self.translators:
-            qui = translator['qui']
-            style_markers = translator.get('style_markers', {})
-            
+        for qui, mask, style_markers in zip(self._qui, self._features, self._style):
             # Analyser niveau formalisation
-            formalisation = style_markers.get('formalisation', '')
-            if 'élevée' in formalisation or 'très' in formalisation:
+            if mask & FLAG_FORMAL_HIGH:
                 style_signatures['Formalisation élevée'].append(qui)
-            elif 'moyenne' in formalisation:
+            elif mask & FLAG_FORMAL_MEDIUM:
                 style_signatures['Formalisation moyenne'].append(qui)
             
             # Analyser subordinations
-            sub_ratio = style_markers.get('subordinations_complexes', 0)
-            if sub_ratio > 0.7:
+            if mask & FLAG_SUB_HIGH:
                 style_signatures['Style complexe (sub>0.7)'].append(qui)
-            elif sub_ratio < 0.5:
+            elif mask & FLAG_SUB_LOW:
                 style_signatures['Style simple (sub<0.5)'].append(qui)
             
             # Patterns spécifiques
@@ -134,12 +188,9 @@ class BiasPatternAnalyzer:
         
         cross_refs = []
         
-        for translator in self.translators:
-            qui = translator['qui']
-            ou = translator.get('ou', '')
-            quand = translator.get('quand', '')
-            biais = translator.get('biais', {})
-            style = translator.get('style_markers', {})
+        for qui, ou, quand, biais, style in zip(
+            self._qui, self._ou, self._quand, self._biais, self._style
+        ):
             
             # Créer profil combiné
             profile = {
@@ -147,10 +198,11 @@ class BiasPatternAnalyzer:
                 "contexte_geo": ou.split(',')[0] if ',' in ou else ou,
                 "periode": quand,
                 "biais_dominants": [k for k, v in biais.items()],
-                "style_caracteristiques": [
-                    f"{k}:{v}" for k, v in style.items() 
-                    if isinstance(v, (int, float, str)) and str(v)
-                ][:3]
+                "style_caracteristiques": list(islice(
+                    (f"{k}:{v}" for k, v in style.items()
+                     if isinstance(v, (int, float, str)) and v != ''),
+                    3
+                ))
             }
             
             cross_refs.append(profile)
@@ -173,12 +225,9 @@ class BiasPatternAnalyzer:
         all_bias_types = []
         all_style_markers = []
         
-        for translator in self.translators:
-            biais = translator.get('biais', {})
-            style = translator.get('style_markers', {})
-            
-            all_bias_types.extend(biais.keys())
-            all_style_markers.extend(style.keys())
+        for biais, style in zip(self._biais, self._style):
+            all_bias_types.extend(biais)
+            all_style_markers.extend(style)
         
         # Récurrents = potentiellement universaux
         from collections import Counter
@@ -216,20 +265,34 @@ class BiasPatternAnalyzer:
             "contextual": contextual
         }
     
-    def export_analysis(self, filepath: str = "translator_bias_style_analysis.json"):
-        """Exporter analyse complète"""
+    def export_analysis(self, filepath: str = "translator_bias_style_analysis.json",
+                        parallel: bool = False):
+        """Exporter analyse complète
+        
+        parallel=True exécute les analyses indépendantes dans un
+        ThreadPoolExecutor (sorties console entrelacées).
+        """
         analysis = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "traducteurs_analyses": len(self.translators),
-            "patterns_culturels": self.analyze_cultural_bias_patterns(),
-            "patterns_temporels": self.analyze_temporal_bias_patterns(),
-            "signatures_stylistiques": self.analyze_style_signature_patterns(),
-            "cross_references": self.cross_reference_patterns(),
-            "universaux_vs_contextuels": self.identify_universal_vs_contextual()
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2, ensure_ascii=False)
+        analyses = [
+            ("patterns_culturels", self.analyze_cultural_bias_patterns),
+            ("patterns_temporels", self.analyze_temporal_bias_patterns),
+            ("signatures_stylistiques", self.analyze_style_signature_patterns),
+            ("cross_references", self.cross_reference_patterns),
+            ("universaux_vs_contextuels", self.identify_universal_vs_contextual)
+        ]
+        
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+                futures = [(key, executor.submit(fn)) for key, fn in analyses]
+            analysis.update((key, future.result()) for key, future in futures)
+        else:
+            analysis.update((key, fn()) for key, fn in analyses)
+        
+        Path(filepath).write_bytes(dumps_json(analysis))
         
         print(f"\n💾 Analyse exportée: {filepath}")
         return analysis
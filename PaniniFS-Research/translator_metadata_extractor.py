@@ -18,15 +18,295 @@ Conformité: ISO 8601, clarifications mission
 
 from datetime import datetime, timezone
 from pathlib import Path
+import hashlib
 import json
+import os
 import re
-from typing import Dict, List, Optional, Any
+import tempfile
+from typing import Dict, List, Optional, Any, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from json_utils import dumps_json
+
+
+# Patterns compilés une fois (dates ISO 8601, langues ISO 639, traducteurs)
+_DATE_RE = re.compile(r'(\d{4}[-_]\d{2}[-_]\d{2})')
+_LANG_RE = re.compile(r'[_\-](en|fr|de|es|it|pt|ru|zh|ja|ar)[_\-]')
+_TRANS_RES = tuple(re.compile(pattern) for pattern in (
+    r'trad(?:uction|uctor)?[_\-](\w+)',
+    r'translator[_\-](\w+)',
+    r'by[_\-](\w+)',
+    r'trans[_\-](\w+)'
+))
+_SUBORD_RE = re.compile(r'\bque\b|\bqui\b|\bdont\b')
+
+# Patterns clés métadonnées (sous-chaînes recherchées dans les clés JSON)
+METADATA_KEYS = [
+    'translator', 'traducteur', 'author', 'auteur',
+    'translation', 'traduction', 'translated_by',
+    'epoch', 'epoque', 'date', 'year', 'annee',
+    'context', 'contexte', 'location', 'lieu',
+    'source_lang', 'target_lang', 'langue_source', 'langue_cible'
+]
+
+
+def _build_key_matcher(keys: List[str]):
+    """Générer un test de sous-chaînes déroulé (aucune boucle Python par clé)"""
+    source = "def match(key):\n    return " + " or ".join(f"{k!r} in key" for k in keys) + "\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["match"]
+
+
+# Déroulé mesuré ~15% plus rapide que l'alternation re compilée sur des clés
+# JSON courtes (google-re2: ~9x plus lent, surcoût d'appel du binding)
+_match_metadata_key = _build_key_matcher(METADATA_KEYS)
+
+# Préfiltre octets: clés minimales ('context' couvre déjà 'contexte').
+# Les clés écrites en échappements \uXXXX ne sont pas détectées.
+_METADATA_NEEDLES = tuple(
+    k.encode('ascii') for k in METADATA_KEYS
+    if not any(other != k and other in k for other in METADATA_KEYS)
+)
+_NEEDLE_OVERLAP = max(map(len, _METADATA_NEEDLES)) - 1
+
+# Au-delà de cette taille, parcours événementiel (ijson) sans construire le DOM
+STREAMING_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Cache findings par fichier corpus (clé: chemin, validé par mtime + taille),
+# en JSON; désactivé par défaut: emplacement suggéré pour TranslatorExtractor(cache_dir=...)
+CACHE_DIR = Path.home() / ".cache" / "translator_extractor"
+
+# Format des entrées cache: incrémenter si les règles de parcours changent
+# (un changement de METADATA_KEYS invalide déjà les entrées via leur empreinte)
+CACHE_VERSION = 2
+_METADATA_KEYS_DIGEST = hashlib.sha1("\n".join(METADATA_KEYS).encode('utf-8')).hexdigest()
+
+
+def _loads_json(data: bytes):
+    """Désérialiser JSON depuis octets (orjson si disponible)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _contains_metadata_needle(data: bytes) -> bool:
+    """Une clé métadonnée peut-elle apparaître dans ces octets ? (casse ASCII ignorée)"""
+    lowered = data.lower()
+    return any(needle in lowered for needle in _METADATA_NEEDLES)
+
+
+def _stream_contains_metadata_needle(fileobj, chunk_size: int = 1 << 20) -> bool:
+    """Préfiltre par blocs (chevauchement pour les clés à cheval)"""
+    tail = b''
+    while chunk := fileobj.read(chunk_size):
+        window = tail + chunk
+        if _contains_metadata_needle(window):
+            return True
+        tail = window[-_NEEDLE_OVERLAP:]
+    return False
+
+
+def _format_path(node: Optional[Tuple]) -> str:
+    """
+    Construire le chemin "root.a[0].b" d'un nœud (parent, segment)
+    
+    Les chemins sont chaînés par référence pendant le parcours et ne sont
+    assemblés en chaîne que pour les clés retenues.
+    """
+    segments = []
+    while node is not None:
+        node, segment = node
+        segments.append(f"[{segment}]" if isinstance(segment, int) else f".{segment}")
+    return "root" + "".join(reversed(segments))
+
+
+def _stream_json_findings(fileobj) -> List[Dict]:
+    """
+    Recherche métadonnées sur flux d'événements ijson
+    
+    Même parcours et mêmes findings que extract_from_json_content sans
+    charger le document: 20 premiers items par liste, et les findings
+    trouvés dans une liste sont mis en attente puis abandonnés si elle
+    atteint 100 items. Les valeurs des clés correspondantes ne sont
+    reconstruites que jusqu'à l'aperçu de 200 caractères.
+    """
+    findings = []
+    frames = []    # [type, nœud chemin, clé | index suivant, findings en attente]
+    builders = []  # [profondeur, ObjectBuilder, finding, caractères reçus]
+    skip = 0       # profondeur restante d'un item de liste ignoré
+    
+    for _, event, value in ijson.parse(fileobj, use_float=True):
+        if builders:
+            _feed_preview_builders(builders, event, value)
+        
+        if skip:
+            if event in ('start_map', 'start_array'):
+                skip += 1
+            elif event in ('end_map', 'end_array'):
+                skip -= 1
+            continue
+        
+        if event == 'map_key':
+            frames[-1][2] = value
+            continue
+        
+        if event in ('end_map', 'end_array'):
+            kind, _, count, pending = frames.pop()
+            if builders and builders[-1][0] == len(frames):
+                _, builder, finding, _ = builders.pop()
+                finding["value"] = str(builder.value)[:200]
+            if kind == 'array' and count < 100:
+                # Liste parcourue: ses findings rejoignent le conteneur parent
+                _pending_findings(frames, findings).extend(pending)
+            continue
+        
+        # Début d'une valeur (scalaire ou conteneur)
+        key = None
+        if not frames:
+            node = None
+        elif frames[-1][0] == 'map':
+            key = frames[-1][2]
+            node = (frames[-1][1], key)
+        else:
+            frame = frames[-1]
+            index = frame[2]
+            frame[2] += 1
+            if index >= 20:  # Max 20 items
+                if index == 99:
+                    # Liste >= 100 items: non parcourue
+                    frame[3].clear()
+                    depth = len(frames) - 1
+                    builders[:] = [b for b in builders if b[0] <= depth]
+                if event in ('start_map', 'start_array'):
+                    skip = 1
+                continue
+            node = (frame[1], index)
+        
+        if key is not None and _match_metadata_key(key.lower()):
+            if event in ('start_map', 'start_array'):
+                finding = {"path": _format_path(node), "key": key, "value": None,
+                           "type": 'dict' if event == 'start_map' else 'list'}
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                builders.append([len(frames), builder, finding, 0])
+            else:
+                finding = {"path": _format_path(node), "key": key,
+                           "value": str(value)[:200], "type": type(value).__name__}
+            _pending_findings(frames, findings).append(finding)
+        
+        if event == 'start_map':
+            frames.append(['map', node, None, None])
+        elif event == 'start_array':
+            frames.append(['array', node, 0, []])
+    
+    return findings
+
+
+def _pending_findings(frames: List[list], findings: List[Dict]) -> List[Dict]:
+    """Findings en attente de la liste englobante la plus proche (sinon résultat)"""
+    for frame in reversed(frames):
+        if frame[0] == 'array':
+            return frame[3]
+    return findings
+
+
+def _feed_preview_builders(builders: List[list], event: str, value):
+    """
+    Alimenter les valeurs en reconstruction, arrêtées à l'aperçu complet
+    
+    str() d'une valeur partielle est un préfixe de celui de la valeur
+    finale suivi des fermetures des conteneurs ouverts: dès que ce préfixe
+    atteint 200 caractères, l'aperçu ne change plus. Les caractères des
+    clés et scalaires reçus évitent de recalculer str() avant ce seuil.
+    """
+    done = False
+    for entry in builders:
+        builder = entry[1]
+        builder.event(event, value)
+        if event in ('start_map', 'start_array', 'end_map', 'end_array'):
+            continue
+        entry[3] += len(str(value))
+        if entry[3] >= 200:
+            text = str(builder.value)
+            if len(text) - len(builder.containers) >= 200:
+                entry[2]["value"] = text[:200]
+                entry[0] = -1
+                done = True
+    if done:
+        builders[:] = [entry for entry in builders if entry[0] != -1]
+
+
+def _extract_one(path_str: str) -> Tuple[Optional[List[Dict]], Optional[str]]:
+    """Extraction d'un fichier corpus (exécutable dans un processus worker)"""
+    filepath = Path(path_str)
+    try:
+        return _search_json_findings(filepath, filepath.stat().st_size), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _search_json_findings(filepath: Path, size: int) -> List[Dict]:
+    """Rechercher métadonnées dans un fichier JSON corpus"""
+    # Fichier sans aucune clé candidate: parsing inutile
+    if ijson is not None and size > STREAMING_THRESHOLD_BYTES:
+        with open(filepath, 'rb') as f:
+            if not _stream_contains_metadata_needle(f):
+                return []
+            f.seek(0)
+            return _stream_json_findings(f)
+    
+    raw = filepath.read_bytes()
+    if not _contains_metadata_needle(raw):
+        return []
+    data = _loads_json(raw)
+    
+    findings = []
+    
+    # Parcours itératif en profondeur (même ordre que la récursion)
+    stack = [(None, data, None)]
+    while stack:
+        key, obj, node = stack.pop()
+        
+        # Vérifier si clé correspond à métadonnée
+        if key is not None and _match_metadata_key(key.lower()):
+            findings.append({
+                "path": _format_path(node),
+                "key": key,
+                "value": str(obj)[:200],
+                "type": type(obj).__name__
+            })
+        
+        if isinstance(obj, dict):
+            stack.extend((k, v, (node, k)) for k, v in reversed(obj.items()))
+        elif isinstance(obj, list) and len(obj) < 100:
+            items = obj[:20]  # Max 20 items
+            stack.extend(
+                (None, items[i], (node, i)) for i in reversed(range(len(items)))
+            )
+    
+    return findings
 
 
 class TranslatorMetadata:
     """Métadonnées traducteur selon clarifications mission"""
     
+    __slots__ = (
+        'name', 'translations', 'epoch', 'cultural_context', 'source_lang',
+        'target_lang', 'corpus', 'style_markers', 'bias_indicators'
+    )
+    
     def __init__(self, name: str):
         self.name = name
         self.translations: List[Dict] = []
@@ -55,7 +335,8 @@ class TranslatorMetadata:
 class TranslatorExtractor:
     """Extracteur métadonnées traducteurs depuis corpus"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir  # None = pas de cache (défaut)
         self.translators: Dict[str, TranslatorMetadata] = {}
         self.corpus_files: List[Path] = []
         self.extraction_log: List[Dict] = []
@@ -64,23 +345,26 @@ class TranslatorExtractor:
         """Scanner fichiers corpus disponibles"""
         print(f"🔍 Scan corpus dans: {directory}")
         
-        patterns = [
-            "*corpus*.json",
-            "*traduction*.json", 
-            "*translation*.json",
-            "*multilingu*.json",
-            "*content*.json"
-        ]
-        
-        found_files = []
-        for pattern in patterns:
-            found_files.extend(Path(directory).glob(pattern))
+        # Équivalent des globs "*corpus*.json", "*traduction*.json", etc.
+        # (dossier + sous-dossiers) en un seul parcours; dossiers et fichiers
+        # cachés ignorés (.git, .venv...), ordre trié donc déterministe
+        name_hints = ("corpus", "traduction", "translation", "multilingu", "content")
         
-        # Chercher aussi dans sous-dossiers
-        for pattern in patterns:
-            found_files.extend(Path(directory).glob(f"**/{pattern}"))
+        max_files = 50  # Max 50 fichiers: parcours arrêté dès qu'atteint
+        found_files = {}  # dict: dédoublonnage en conservant l'ordre
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+            for name in sorted(filenames):
+                if name.startswith('.'):
+                    continue
+                if name.endswith(".json") and any(hint in name for hint in name_hints):
+                    found_files[Path(dirpath) / name] = None
+                    if len(found_files) >= max_files:
+                        break
+            if len(found_files) >= max_files:
+                break
         
-        self.corpus_files = list(set(found_files))[:50]  # Max 50 fichiers
+        self.corpus_files = list(found_files)
         
         print(f"   Fichiers trouvés: {len(self.corpus_files)}")
         for f in self.corpus_files[:10]:
@@ -93,27 +377,22 @@ class TranslatorExtractor:
     def extract_from_filename(self, filepath: Path) -> Optional[Dict]:
         """Extraire indices depuis nom fichier"""
         filename = filepath.stem
+        filename_lower = filename.lower()
+        
+        # findall compilés séparés (un par pattern traducteur): plus rapides
+        # sur noms courts qu'une alternation unique, qui en plus consommerait
+        # les séparateurs partagés et perdrait les indices chevauchants
         
         # Patterns dates ISO 8601 dans nom fichier
-        date_pattern = r'(\d{4}[-_]\d{2}[-_]\d{2})'
-        dates = re.findall(date_pattern, filename)
+        dates = _DATE_RE.findall(filename)
         
         # Patterns langues (codes ISO 639)
-        lang_pattern = r'[_\-](en|fr|de|es|it|pt|ru|zh|ja|ar)[_\-]'
-        langs = re.findall(lang_pattern, filename.lower())
+        langs = _LANG_RE.findall(filename_lower)
         
         # Patterns traduction
-        trans_patterns = [
-            r'trad(?:uction|uctor)?[_\-](\w+)',
-            r'translator[_\-](\w+)',
-            r'by[_\-](\w+)',
-            r'trans[_\-](\w+)'
-        ]
-        
         translator_hints = []
-        for pattern in trans_patterns:
-            matches = re.findall(pattern, filename.lower())
-            translator_hints.extend(matches)
+        for pattern in _TRANS_RES:
+            translator_hints.extend(pattern.findall(filename_lower))
         
         if dates or langs or translator_hints:
             return {
@@ -125,85 +404,143 @@ class TranslatorExtractor:
         return None
     
     def extract_from_json_content(self, filepath: Path) -> List[Dict]:
-        """Extraire métadonnées depuis contenu JSON"""
+        """Extraire métadonnées depuis contenu JSON (cache disque mtime/taille)"""
+        return self._extract_contents([filepath])[0]
+    
+    def _extract_contents(self, filepaths: List[Path],
+                          max_workers: int = 1) -> List[List[Dict]]:
+        """
+        Extraire contenu JSON de plusieurs fichiers
+        
+        Traitement séquentiel par défaut; avec max_workers > 1, les fichiers
+        hors cache sont répartis sur un ProcessPoolExecutor. Cache et journal
+        d'erreurs restent gérés dans le processus principal.
+        """
+        outcomes: Dict[int, Tuple[Optional[List[Dict]], Optional[str]]] = {}
+        pending = []  # (index, stat) fichiers à analyser
+        
+        for index, filepath in enumerate(filepaths):
+            try:
+                stat = filepath.stat()
+            except OSError as e:
+                outcomes[index] = (None, str(e))
+                continue
+            findings = self._load_cached_findings(filepath, stat)
+            if findings is not None:
+                outcomes[index] = (findings, None)
+            else:
+                pending.append((index, stat))
+        
+        paths = [str(filepaths[index]) for index, _ in pending]
+        if len(paths) > 1 and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_extract_one, paths, chunksize=4))
+        else:
+            results = [_extract_one(path) for path in paths]
+        
+        for (index, stat), (findings, error) in zip(pending, results):
+            if error is None:
+                self._store_cached_findings(filepaths[index], stat, findings)
+            outcomes[index] = (findings, error)
+        
+        contents = []
+        for index, filepath in enumerate(filepaths):
+            findings, error = outcomes[index]
+            if error is not None:
+                self.extraction_log.append({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "file": str(filepath),
+                    "error": error
+                })
+                findings = []
+            contents.append(findings)
+        return contents
+    
+    def _cache_path(self, filepath: Path) -> Path:
+        """Fichier cache associé à un chemin corpus"""
+        digest = hashlib.sha1(str(filepath.resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def _load_cached_findings(self, filepath: Path, stat: os.stat_result) -> Optional[List[Dict]]:
+        """Retourner findings en cache si fichier inchangé (mtime + taille)"""
+        if self.cache_dir is None:
+            return None
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            findings = []
-            
-            # Patterns clés métadonnées
-            metadata_keys = [
-                'translator', 'traducteur', 'author', 'auteur',
-                'translation', 'traduction', 'translated_by',
-                'epoch', 'epoque', 'date', 'year', 'annee',
-                'context', 'contexte', 'location', 'lieu',
-                'source_lang', 'target_lang', 'langue_source', 'langue_cible'
-            ]
-            
-            def recursive_search(obj, path="root"):
-                """Recherche récursive métadonnées"""
-                if isinstance(obj, dict):
-                    for key, value in obj.items():
-                        key_lower = key.lower()
-                        
-                        # Vérifier si clé correspond à métadonnée
-                        for meta_key in metadata_keys:
-                            if meta_key in key_lower:
-                                findings.append({
-                                    "path": f"{path}.{key}",
-                                    "key": key,
-                                    "value": str(value)[:200],
-                                    "type": type(value).__name__
-                                })
-                        
-                        # Récursion
-                        recursive_search(value, f"{path}.{key}")
-                
-                elif isinstance(obj, list) and len(obj) < 100:
-                    for i, item in enumerate(obj[:20]):  # Max 20 items
-                        recursive_search(item, f"{path}[{i}]")
-            
-            recursive_search(data)
-            return findings
-            
-        except Exception as e:
-            self.extraction_log.append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "file": str(filepath),
-                "error": str(e)
-            })
-            return []
+            cached = _loads_json(self._cache_path(filepath).read_bytes())
+        except (OSError, ValueError):
+            # Cache absent ou illisible
+            return None
+        if (isinstance(cached, dict)
+                and cached.get("version") == CACHE_VERSION
+                and cached.get("keys_digest") == _METADATA_KEYS_DIGEST
+                and cached.get("mtime_ns") == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size
+                and isinstance(cached.get("findings"), list)):
+            return cached["findings"]
+        return None
+    
+    def _store_cached_findings(self, filepath: Path, stat: os.stat_result, findings: List[Dict]):
+        """Mémoriser findings (échec d'écriture cache non bloquant)"""
+        if self.cache_dir is None:
+            return
+        entry = {
+            "version": CACHE_VERSION,
+            "keys_digest": _METADATA_KEYS_DIGEST,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "findings": findings
+        }
+        cache_path = self._cache_path(filepath)
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Fichier temporaire unique: exécutions concurrentes sans collision
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                f.write(dumps_json(entry))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def analyze_style_markers(self, text: str) -> Dict:
         """Analyser patterns stylistiques texte"""
         if not text or len(text) < 50:
             return {}
         
-        # Métriques basiques
+        # Métriques basiques (str.count: recherche C, plus rapide que translate)
         words = text.split()
+        text_lower = text.lower()
         sentences = text.count('.') + text.count('!') + text.count('?')
+        joined_length = sum(map(len, words)) + max(len(words) - 1, 0)  # len(' '.join(words))
         
         markers = {
-            "longueur_mots_moyenne": len(' '.join(words)) / max(len(words), 1),
+            "longueur_mots_moyenne": joined_length / max(len(words), 1),
             "phrases_complexes": text.count(',') / max(sentences, 1),
-            "formalisation": "élevée" if any(w in text.lower() for w in ['néanmoins', 'toutefois', 'ainsi']) else "standard"
+            "formalisation": "élevée" if any(w in text_lower for w in ['néanmoins', 'toutefois', 'ainsi']) else "standard"
         }
         
         # Subordinations
-        subordinations = len(re.findall(r'\bque\b|\bqui\b|\bdont\b', text.lower()))
+        subordinations = len(_SUBORD_RE.findall(text_lower))
         markers["subordinations_ratio"] = subordinations / max(len(words), 1)
         
         return markers
     
-    def process_all_corpus(self):
+    def process_all_corpus(self, max_workers: int = 1):
         """Traiter tous fichiers corpus"""
         print(f"\n📊 Traitement corpus...")
         print(f"   Timestamp: {datetime.now(timezone.utc).isoformat()}\n")
         
         total_findings = 0
         
-        for filepath in self.corpus_files:
+        # Extraction contenu (fichiers indépendants, en parallèle)
+        contents = self._extract_contents(self.corpus_files, max_workers)
+        
+        for filepath, content_findings in zip(self.corpus_files, contents):
             print(f"   Analyse: {filepath.name}")
             
             # Extraction nom fichier
@@ -213,8 +550,6 @@ class TranslatorExtractor:
                       f"{len(filename_data.get('languages', []))} langues")
                 total_findings += 1
             
-            # Extraction contenu
-            content_findings = self.extract_from_json_content(filepath)
             if content_findings:
                 print(f"      Métadonnées trouvées: {len(content_findings)}")
                 total_findings += len(content_findings)
@@ -230,30 +565,51 @@ class TranslatorExtractor:
         print(f"\n   Total indices trouvés: {total_findings}")
         print(f"   Traducteurs identifiés: {len(self.translators)}")
     
+    def _report_sections(self):
+        """Sections rapport dans l'ordre; traducteurs produits à la demande"""
+        yield "timestamp", datetime.now(timezone.utc).isoformat()
+        yield "scan_summary", {
+            "fichiers_scannes": len(self.corpus_files),
+            "traducteurs_identifies": len(self.translators),
+            "total_findings": len(self.extraction_log)
+        }
+        yield "traducteurs", (
+            (name, meta.to_dict()) for name, meta in self.translators.items()
+        )
+        yield "fichiers_corpus", [str(f) for f in self.corpus_files]
+        yield "extraction_log", self.extraction_log[-50:]  # Derniers 50
+    
     def generate_report(self) -> Dict:
         """Générer rapport extraction"""
-        report = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "scan_summary": {
-                "fichiers_scannes": len(self.corpus_files),
-                "traducteurs_identifies": len(self.translators),
-                "total_findings": len(self.extraction_log)
-            },
-            "traducteurs": {
-                name: meta.to_dict() 
-                for name, meta in self.translators.items()
-            },
-            "fichiers_corpus": [str(f) for f in self.corpus_files],
-            "extraction_log": self.extraction_log[-50:]  # Derniers 50
+        return {
+            key: dict(value) if key == "traducteurs" else value
+            for key, value in self._report_sections()
         }
-        return report
     
     def export_results(self, filepath: str = "translator_metadata_extraction.json"):
-        """Exporter résultats"""
-        report = self.generate_report()
+        """
+        Exporter résultats
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        Écriture incrémentale (même JSON indenté que generate_report): un
+        seul to_dict() traducteur en mémoire à la fois.
+        """
+        with open(filepath, 'wb') as f:
+            f.write(b'{')
+            for index, (key, value) in enumerate(self._report_sections()):
+                f.write(b',\n  ' if index else b'\n  ')
+                f.write(dumps_json(key) + b': ')
+                if key != "traducteurs":
+                    f.write(dumps_json(value).replace(b'\n', b'\n  '))
+                    continue
+                
+                empty = True
+                for name, meta_dict in value:
+                    f.write(b'{\n    ' if empty else b',\n    ')
+                    f.write(dumps_json(name) + b': ')
+                    f.write(dumps_json(meta_dict).replace(b'\n', b'\n    '))
+                    empty = False
+                f.write(b'{}' if empty else b'\n  }')
+            f.write(b'\n}')
         
         print(f"\n�� Résultats exportés: {filepath}")
         return filepath
@@ -331,8 +687,7 @@ def create_sample_translator_database():
         "traducteurs": sample_translators
     }
     
-    with open("translator_database_sample.json", 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    Path("translator_database_sample.json").write_bytes(dumps_json(output))
     
     print(f"   ✅ Base exemple créée: translator_database_sample.json")
     print(f"   Traducteurs exemple: {len(sample_translators)}")
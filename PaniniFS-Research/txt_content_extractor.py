@@ -21,13 +21,24 @@ Version: 1.0
 """
 
 import sys
-import json
+import codecs
 import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
+from itertools import islice
 import re
 
+from json_utils import dumps_json
+
+
+# Tokenisation, détection dhātu (majuscules latines + translittération
+# sanskrite) et titres sections. \b et \w doivent rester Unicode: pas de
+# google-re2 ici (ses \b/\w sont ASCII et couperaient "saṃsāra")
+_WORD_RE = re.compile(r'\b\w+\b')
+_DHATU_RE = re.compile(r'\b[A-ZĀĪŪṚḶṂṆṄ]{2,}\b')
+_CONCEPT_RE = re.compile(r'### (.+)')
+
 
 class TXTContentExtractor:
     """Extracteur contenu fichiers TXT avec validation intégrité"""
@@ -49,15 +60,22 @@ class TXTContentExtractor:
             return self._error_result(f"File not found: {txt_path}")
             
         try:
-            # Lecture contenu
-            with open(txt_path, 'r', encoding=self.encoding) as f:
-                content = f.read()
+            # Lecture contenu (octets bruts conservés pour le hash)
+            with open(txt_path, 'rb') as f:
+                raw = f.read()
+            content = raw.decode(self.encoding)
+            # Sur le texte décodé, avant normalisation (terminateurs multi-
+            # octets en UTF-16/32: pas de recherche sur les octets bruts)
+            line_endings = self._detect_line_endings(content)
+            if '\r' in content:
+                # Newlines universels, comme une lecture en mode texte
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
                 
             # Extraction métadonnées
-            metadata = self._extract_metadata(txt_path, content)
+            metadata = self._extract_metadata(txt_path, content, len(raw), line_endings)
             
             # Validation intégrité
-            integrity = self._validate_integrity(content)
+            integrity = self._validate_integrity(content, raw)
             
             # Analyse sémantique basique
             semantic_analysis = self._analyze_semantics(content)
@@ -68,7 +86,7 @@ class TXTContentExtractor:
                 "source_file": str(txt_path),
                 "content": content,
                 "content_length_chars": len(content),
-                "content_length_lines": len(content.split('\n')),
+                "content_length_lines": content.count('\n') + 1,  # == len(split('\n'))
                 "metadata": metadata,
                 "integrity": integrity,
                 "semantic_analysis": semantic_analysis,
@@ -80,13 +98,15 @@ class TXTContentExtractor:
         except Exception as e:
             return self._error_result(f"Extraction error: {e}")
             
-    def _extract_metadata(self, txt_path: Path, content: str) -> Dict:
-        """Extrait métadonnées depuis fichier + contenu"""
+    def _extract_metadata(self, txt_path: Path, content: str, size_bytes: int,
+                          line_endings: str) -> Dict:
+        """Extrait métadonnées depuis fichier + contenu (taille et line endings
+        déterminés avant normalisation des sauts de ligne)"""
         metadata = {
             "filename": txt_path.name,
-            "file_size_bytes": txt_path.stat().st_size,
+            "file_size_bytes": size_bytes,
             "encoding": self.encoding,
-            "line_endings": self._detect_line_endings(content)
+            "line_endings": line_endings
         }
         
         # Extraction métadonnées depuis contenu (si format structuré)
@@ -97,13 +117,14 @@ class TXTContentExtractor:
         return metadata
         
     def _detect_line_endings(self, content: str) -> str:
-        """Détecte type line endings"""
-        if '\r\n' in content:
-            return 'CRLF (Windows)'
-        elif '\n' in content:
+        """Détecte type line endings (d'après le premier terminateur)"""
+        # Recherches bornées: s'arrêtent au premier saut de ligne
+        first_lf = content.find('\n')
+        first_cr = content.find('\r', 0, first_lf if first_lf != -1 else len(content))
+        if first_cr != -1:
+            return 'CRLF (Windows)' if content.startswith('\n', first_cr + 1) else 'CR (Mac)'
+        elif first_lf != -1:
             return 'LF (Unix)'
-        elif '\r' in content:
-            return 'CR (Mac)'
         return 'None'
         
     def _parse_header_metadata(self, content: str) -> Optional[Dict]:
@@ -119,14 +140,19 @@ class TXTContentExtractor:
             
         return metadata if metadata else None
         
-    def _validate_integrity(self, content: str) -> Dict:
+    def _validate_integrity(self, content: str, raw: bytes) -> Dict:
         """Valide intégrité contenu"""
-        # Hash SHA-256
-        content_bytes = content.encode('utf-8')
-        sha256_hash = hashlib.sha256(content_bytes).hexdigest()
+        # Hash SHA-256 du contenu normalisé encodé en UTF-8; les octets lus
+        # sont réutilisés sans ré-encodage quand ils y sont identiques
+        # (fichier UTF-8 sans CR)
+        if codecs.lookup(self.encoding).name == 'utf-8' and b'\r' not in raw:
+            data = raw
+        else:
+            data = content.encode('utf-8')
+        sha256_hash = hashlib.sha256(data).hexdigest()
         
-        # Validation basique
-        is_valid = len(content) > 0 and content.isprintable() or '\n' in content
+        # Validation basique (isprintable échantillonné: le hash prouve l'intégrité)
+        is_valid = '\n' in content or (len(content) > 0 and content[:4096].isprintable())
         
         return {
             "valid": is_valid,
@@ -137,28 +163,28 @@ class TXTContentExtractor:
         
     def _analyze_semantics(self, content: str) -> Dict:
         """Analyse sémantique basique"""
-        # Comptage mots
-        words = re.findall(r'\b\w+\b', content)
-        unique_words = set(w.lower() for w in words)
+        # Comptage mots: une seule tokenisation, statistiques dérivées en C
+        words = _WORD_RE.findall(content)
+        unique_words = set(map(str.lower, words))
+        total_length = sum(map(len, words))
         
-        # Détection dhātu mentions (patterns Sanskrit)
-        dhatu_pattern = r'\b[A-ZĀĪŪṚḶṂṆṄṄṄṄṆṆṆṆṆṆṆṆṆṆṂĀĪŪṚḶṂṆṄṄṄṄṆṆṆṆṆṆṆṆṆṆṂ]{2,}\b'
-        dhatu_candidates = re.findall(dhatu_pattern, content)
+        # Détection dhātu mentions (patterns Sanskrit), arrêt au Top 10
+        dhatu_candidates = [m.group() for m in islice(_DHATU_RE.finditer(content), 10)]
         
         # Extraction concepts (titres sections)
-        concepts = re.findall(r'### (.+)', content)
+        concepts = _CONCEPT_RE.findall(content)
         
-        # Patterns composition (mots composés)
-        compound_words = [w for w in words if len(w) > 10]
+        # Patterns composition (mots composés), arrêt à l'échantillon
+        compound_words = list(islice((w for w in words if len(w) > 10), 5))
         
         return {
             "total_words": len(words),
             "unique_words": len(unique_words),
             "vocabulary_richness": round(len(unique_words) / len(words), 3) if words else 0,
-            "dhatu_candidates": dhatu_candidates[:10],  # Top 10
+            "dhatu_candidates": dhatu_candidates,
             "concepts_detected": concepts,
-            "compound_words_sample": compound_words[:5],
-            "avg_word_length": round(sum(len(w) for w in words) / len(words), 2) if words else 0
+            "compound_words_sample": compound_words,
+            "avg_word_length": round(total_length / len(words), 2) if words else 0
         }
         
     def _error_result(self, error_msg: str) -> Dict:
@@ -177,8 +203,7 @@ class TXTContentExtractor:
             timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H-%M-%SZ')
             output_path = Path(f"txt_extraction_{timestamp}.json")
             
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(dumps_json(result))
             
         return output_path
 
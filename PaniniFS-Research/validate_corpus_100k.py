@@ -17,14 +17,55 @@ Date: 2025-10-01
 Durée: 10-15 minutes
 """
 
-import json
-import hashlib
+import math
+from array import array
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from collections import Counter
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+from json_utils import dumps_json
+
+
+@dataclass
+class Corpus:
+    """Corpus en colonnes (SoA): id implicite = index."""
+    texts: List[str]
+    langs: List[str]
+    lengths: array
+    malformed: int = 0
+    lang_counts: Optional[Dict[str, int]] = None  # connu par construction
+    
+    def __len__(self) -> int:
+        return len(self.texts) + self.malformed
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, Any]]) -> 'Corpus':
+        """Construit corpus depuis entrées dict (schéma validé une fois)."""
+        texts = []
+        langs = []
+        malformed = 0
+        
+        for entry in entries:
+            # Check structure (EAFP: entrées malformées rares)
+            try:
+                text = entry['text']
+                lang = entry['language']
+            except (KeyError, TypeError):
+                malformed += 1
+                continue
+            
+            texts.append(text)
+            langs.append(lang)
+        
+        return cls(texts, langs, array('i', map(len, texts)), malformed)
+
 
 @dataclass
 class CorpusStats:
@@ -37,9 +78,10 @@ class CorpusStats:
     max_length: int
     duplicates: int
     malformed: int
+    dedup_error_rate: Optional[float] = None  # Bloom: doublons approximatifs
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        result = {
             'total_sentences': self.total_sentences,
             'unique_sentences': self.unique_sentences,
             'duplication_rate': round(self.duplicates / self.total_sentences * 100, 2) if self.total_sentences > 0 else 0,
@@ -54,17 +96,34 @@ class CorpusStats:
                 'malformed_rate': round(self.malformed / self.total_sentences * 100, 2) if self.total_sentences > 0 else 0
             }
         }
+        if self.dedup_error_rate is not None:
+            result['duplication_approximate'] = True
+            result['dedup_false_positive_rate'] = self.dedup_error_rate
+        return result
 
 
 class CorpusValidator:
     """Validateur corpus massif."""
     
-    def __init__(self, target_size: int = 100000):
+    def __init__(self, target_size: int = 100000, dedup_error_rate: Optional[float] = None):
+        """dedup_error_rate: si fourni (et pybloom_live installé), doublons
+        détectés par filtre de Bloom (~10 bits/phrase au lieu d'un set[str]);
+        les faux positifs comptent comme doublons."""
         self.target_size = target_size
-        self.seen_hashes: Set[str] = set()
+        self.seen_texts: Set[str] = set()
+        self.bloom = None
+        if dedup_error_rate is not None and ScalableBloomFilter is not None:
+            self.bloom = ScalableBloomFilter(
+                initial_capacity=max(target_size, 100),
+                error_rate=dedup_error_rate
+            )
     
-    def generate_synthetic_corpus(self, size: int) -> List[Dict[str, Any]]:
-        """Génère corpus synthétique pour validation."""
+    def generate_synthetic_corpus(self, size: int) -> Tuple[Corpus, int]:
+        """Génère corpus synthétique pour validation.
+        
+        Retourne (corpus, n_unique): n_unique est le nombre de phrases
+        distinctes, connu par construction.
+        """
         
         print(f"🏗️  Génération corpus synthétique ({size:,} phrases)...")
         
@@ -76,15 +135,17 @@ class CorpusValidator:
             "El {subject_es} {verb_es} el {object_es}.",
             "Der {subject_de} {verb_de} den {object_de}.",
         ]
+        template_langs = ("fr", "en", "sa", "es", "de")
         
         subjects = ["roi", "sage", "guerrier", "enfant", "maître", "étudiant"]
         verbs = ["conquiert", "enseigne", "protège", "étudie", "comprend", "découvre"]
         objects = ["royaume", "savoir", "peuple", "vérité", "texte", "chemin"]
         
-        corpus = []
-        
-        for i in range(size):
-            # Generate sentence
+        # Le cycle (template, sujet, verbe, objet) est périodique:
+        # on ne formate que les phrases distinctes d'une période
+        period = math.lcm(len(templates), len(subjects), len(verbs), len(objects))
+        unique_sentences = []
+        for i in range(period):
             template = templates[i % len(templates)]
             
             if "subject}" in template:
@@ -108,86 +169,101 @@ class CorpusValidator:
             else:
                 sentence = template
             
-            # Detect language
-            if "Le " in sentence or "l'" in sentence:
-                lang = "fr"
-            elif "The " in sentence:
-                lang = "en"
-            elif "।" in sentence:
-                lang = "sa"
-            elif "El " in sentence:
-                lang = "es"
-            elif "Der " in sentence:
-                lang = "de"
-            else:
-                lang = "unknown"
-            
-            # Add to corpus
-            corpus.append({
-                'id': i,
-                'text': sentence,
-                'language': lang,
-                'length': len(sentence),
-                'annotated': True
-            })
-            
-            # Progress
-            if (i + 1) % 10000 == 0:
-                print(f"   {i + 1:,} phrases générées...")
+            unique_sentences.append(sentence)
+        
+        unique_langs = [template_langs[i % len(templates)] for i in range(period)]
+        unique_lengths = [len(s) for s in unique_sentences]
+        
+        # Réplication de la période (références, aucune copie de chaîne)
+        reps, rest = divmod(size, period)
+        
+        # Distribution des langues par arithmétique sur la période
+        # (même ordre d'apparition que Counter sur la colonne)
+        per_period = Counter(unique_langs)
+        head = Counter(unique_langs[:rest])
+        lang_counts = {}
+        for lang, n in per_period.items():
+            count = n * reps + head[lang]
+            if count:
+                lang_counts[lang] = count
+        
+        corpus = Corpus(
+            texts=unique_sentences * reps + unique_sentences[:rest],
+            langs=unique_langs * reps + unique_langs[:rest],
+            lengths=array('i', unique_lengths) * reps + array('i', unique_lengths[:rest]),
+            lang_counts=lang_counts
+        )
         
         print(f"   ✅ {len(corpus):,} phrases")
         print()
         
-        return corpus
+        # Certains templates sont constants: compter les phrases distinctes
+        n_unique = len(set(unique_sentences[:size]))
+        
+        return corpus, n_unique
     
-    def validate_corpus(self, corpus: List[Dict[str, Any]]) -> CorpusStats:
-        """Valide corpus."""
+    def validate_corpus(
+        self,
+        corpus: Union[Corpus, Iterable[Dict[str, Any]]],
+        n_unique: Optional[int] = None
+    ) -> CorpusStats:
+        """Valide corpus.
+        
+        Accepte un Corpus ou, comme avant, une liste d'entrées dict
+        (convertie via Corpus.from_entries, schéma vérifié).
+        Si n_unique est fourni (corpus synthétique, unicité connue par
+        construction), le dédoublonnage par ensemble est sauté et
+        seen_texts n'est pas alimenté. Corpus externes: laisser None.
+        """
         
         print("🔍 Validation corpus...")
         print()
         
-        # Compute stats
-        lengths = []
-        lang_counts = Counter()
-        duplicates = 0
-        malformed = 0
-        
-        for entry in corpus:
-            # Check structure
-            if 'text' not in entry or 'language' not in entry:
-                malformed += 1
-                continue
-            
-            text = entry['text']
-            lang = entry['language']
-            
-            # Check length
-            length = len(text)
-            lengths.append(length)
-            
-            # Check duplicates
-            text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
-            if text_hash in self.seen_hashes:
-                duplicates += 1
-            else:
-                self.seen_hashes.add(text_hash)
-            
-            # Language distribution
-            lang_counts[lang] += 1
+        if not isinstance(corpus, Corpus):
+            corpus = Corpus.from_entries(corpus)
+        
+        texts = corpus.texts
+        
+        # Language distribution (précalculée, sinon comptage en C sur la colonne)
+        lang_counts = corpus.lang_counts
+        if lang_counts is None:
+            lang_counts = Counter(corpus.langs)
+        
+        # Réductions en C (set.update, sum/min/max sur la colonne lengths)
+        if n_unique is None and self.bloom is not None:
+            # add() retourne True si la phrase était (probablement) déjà vue
+            duplicates = 0
+            for text in texts:
+                if self.bloom.add(text):
+                    duplicates += 1
+            unique = len(self.bloom)
+        elif n_unique is None:
+            seen_before = len(self.seen_texts)
+            self.seen_texts.update(texts)
+            duplicates = len(texts) - (len(self.seen_texts) - seen_before)
+            unique = len(self.seen_texts)
+        else:
+            unique = min(len(texts), n_unique)
+            duplicates = len(texts) - unique
+        
+        total_len = sum(corpus.lengths)
+        min_len = min(corpus.lengths, default=0)
+        max_len = max(corpus.lengths, default=0)
+        n_len = len(corpus.lengths)
         
         # Compute statistics
         total = len(corpus)
-        unique = len(self.seen_hashes)
         
         stats = CorpusStats(
             total_sentences=total,
             unique_sentences=unique,
             languages=dict(lang_counts),
-            avg_length=sum(lengths) / len(lengths) if lengths else 0,
-            min_length=min(lengths) if lengths else 0,
-            max_length=max(lengths) if lengths else 0,
+            avg_length=total_len / n_len if n_len else 0,
+            min_length=min_len,
+            max_length=max_len,
             duplicates=duplicates,
-            malformed=malformed
+            malformed=corpus.malformed,
+            dedup_error_rate=self.bloom.error_rate if self.bloom is not None and n_unique is None else None
         )
         
         return stats
@@ -276,10 +352,10 @@ class CorpusValidator:
         print()
         
         # Generate corpus
-        corpus = self.generate_synthetic_corpus(self.target_size)
+        corpus, n_unique = self.generate_synthetic_corpus(self.target_size)
         
         # Validate
-        stats = self.validate_corpus(corpus)
+        stats = self.validate_corpus(corpus, n_unique=n_unique)
         
         # Quality checks
         quality = self.check_quality(stats)
@@ -354,8 +430,7 @@ def main():
     
     # Save
     output_file = Path.cwd() / "corpus_validation_100k.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(dumps_json(result))
     
     print(f"💾 Validation sauvegardée: {output_file.name}")
     print()
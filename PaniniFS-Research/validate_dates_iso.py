@@ -8,12 +8,97 @@ Utilitaire pour valider et corriger les formats de dates selon les règles de co
 import json
 import os
 import re
-import glob
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
 from datetime import datetime, timezone
 from pathlib import Path
 import dateutil.parser
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from json_utils import dumps_json
+
+# Au-delà de cette taille, parcours événementiel (ijson) sans construire l'arbre
+STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+# Forme la plus courante dans les logs: "YYYY-MM-DD HH:MM:SS"
+_FAST_TS_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})')
+
+
+def _loads_json(text):
+    """Désérialiser JSON (orjson si disponible, json pour le reste)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity acceptés par json; sinon message d'erreur habituel
+            pass
+    return json.loads(text)
+
+
+def _iter_workspace_files(directory):
+    """Fichiers du workspace, un seul parcours os.scandir
+    
+    Même ordre et mêmes exclusions que glob("**/*", recursive=True):
+    fichiers d'un dossier puis sous-dossiers en préordre, entrées cachées
+    ignorées. Les liens symboliques vers des dossiers ne sont pas suivis.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if not e.name.startswith('.')]
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        else:
+            yield entry
+    
+    for subdir in subdirs:
+        yield from _iter_workspace_files(subdir)
+
+@lru_cache(maxsize=16384)
+def _parse_to_iso(date_string):
+    """ISO 8601 d'une date (UTC si naïve), None si non interprétable
+    
+    Mémoïsé: les logs répètent les mêmes chaînes de timestamp.
+    """
+    m = _FAST_TS_RE.fullmatch(date_string)
+    if m:
+        try:
+            # datetime() valide les bornes; sinon repli sur dateutil
+            return datetime(*map(int, m.groups()), tzinfo=timezone.utc).isoformat()
+        except ValueError:
+            pass
+    
+    try:
+        # Tentative de parsing avec dateutil
+        parsed_date = dateutil.parser.parse(date_string)
+        
+        # Si pas de timezone, ajouter UTC
+        if parsed_date.tzinfo is None:
+            parsed_date = parsed_date.replace(tzinfo=timezone.utc)
+        
+        return parsed_date.isoformat()
+    except Exception:
+        return None
+
 class DateFormatValidator:
+    # Champs de date: une recherche insensible à la casse (ASCII, comme
+    # key.lower() sur ces mots-clés) au lieu de lower() + 6 sous-chaînes
+    _DATE_FIELD_RE = re.compile(r'date|time|timestamp|created|modified|updated', re.I | re.A)
+    
     def __init__(self):
         self.iso_date_pattern = re.compile(
             r'\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?)?'
@@ -23,6 +108,13 @@ class DateFormatValidator:
             re.compile(r'\d{2}-\d{2}-\d{4}'),  # MM-DD-YYYY ou DD-MM-YYYY
             re.compile(r'\d{4}/\d{2}/\d{2}'),  # YYYY/MM/DD
         ]
+        # Patterns compilés une fois, réutilisés pour chaque fichier
+        self.RE_FILENAME_DATE = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}')
+        # Timestamp en tête de ligne (blancs initiaux tolérés, sans sauter de ligne)
+        self.RE_LOG_TS = re.compile(r'^[^\S\n]*\[([^\]\n]+)\]', re.MULTILINE)
+        # Formes ISO strictes acceptées par is_iso_format
+        self._RE_ISO_DT = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$')
+        self._RE_ISO_D = re.compile(r'^\d{4}-\d{2}-\d{2}$')
         self.violations = []
         
     def validate_filename(self, file_path):
@@ -30,7 +122,7 @@ class DateFormatValidator:
         filename = os.path.basename(file_path)
         
         # Chercher des dates dans le nom de fichier
-        date_matches = re.findall(r'\d{4}[-/]\d{2}[-/]\d{2}', filename)
+        date_matches = self.RE_FILENAME_DATE.findall(filename)
         
         violations = []
         for match in date_matches:
@@ -54,37 +146,47 @@ class DateFormatValidator:
         violations = []
         
         try:
+            if ijson is not None and os.path.getsize(file_path) > STREAMING_THRESHOLD_BYTES:
+                with open(file_path, 'rb') as f:
+                    violations.extend(self._stream_json_violations(f, file_path))
+                return violations
+            
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = _loads_json(f.read())
             
-            def check_recursive(obj, path=""):
+            # Parcours itératif en préordre (même ordre que la récursion):
+            # (clé | index, valeur, chemin parent); chemin construit au besoin
+            stack = [(None, data, "")]
+            while stack:
+                key, obj, path = stack.pop()
+                
+                if key is None:
+                    current_path = path
+                elif isinstance(key, int):
+                    current_path = f"{path}[{key}]"
+                elif DateFormatValidator._DATE_FIELD_RE.search(key):
+                    # Champ de date
+                    current_path = f"{path}.{key}" if path else key
+                    if isinstance(obj, str) and not self.is_iso_format(obj):
+                        violations.append({
+                            'type': 'json_date_format',
+                            'file': file_path,
+                            'field': current_path,
+                            'violation': obj,
+                            'suggested_fix': self.convert_to_iso(obj),
+                            'severity': 'HIGH'
+                        })
+                else:
+                    current_path = None
+                
                 if isinstance(obj, dict):
-                    for key, value in obj.items():
+                    if current_path is None:
                         current_path = f"{path}.{key}" if path else key
-                        
-                        # Vérifier si c'est un champ de date
-                        if any(date_field in key.lower() for date_field in [
-                            'date', 'time', 'timestamp', 'created', 'modified', 'updated'
-                        ]):
-                            if isinstance(value, str):
-                                if not self.is_iso_format(value):
-                                    violations.append({
-                                        'type': 'json_date_format',
-                                        'file': file_path,
-                                        'field': current_path,
-                                        'violation': value,
-                                        'suggested_fix': self.convert_to_iso(value),
-                                        'severity': 'HIGH'
-                                    })
-                        
-                        # Récursion
-                        check_recursive(value, current_path)
-                        
+                    stack.extend(reversed([(k, v, current_path) for k, v in obj.items()]))
                 elif isinstance(obj, list):
-                    for i, item in enumerate(obj):
-                        check_recursive(item, f"{path}[{i}]")
-            
-            check_recursive(data)
+                    if current_path is None:
+                        current_path = f"{path}.{key}" if path else key
+                    stack.extend((i, obj[i], current_path) for i in range(len(obj) - 1, -1, -1))
             
         except Exception as e:
             violations.append({
@@ -96,28 +198,76 @@ class DateFormatValidator:
         
         return violations
     
+    def _stream_json_violations(self, f, file_path):
+        """Violations de dates JSON sur flux d'événements ijson
+        
+        Même ordre et mêmes chemins de champs que check_recursive; une
+        erreur de parsing en cours de flux écarte les violations partielles.
+        """
+        found = []
+        frames = []  # [est_dict, chemin conteneur, clé courante | index suivant]
+        
+        for _, event, value in ijson.parse(f):
+            if event == 'map_key':
+                frames[-1][2] = value
+                continue
+            
+            if event in ('end_map', 'end_array'):
+                frames.pop()
+                continue
+            
+            # Début d'une valeur: chemin calculé comme check_recursive
+            key = None
+            if not frames:
+                current_path = ""
+            elif frames[-1][0]:
+                key = frames[-1][2]
+                path = frames[-1][1]
+                current_path = f"{path}.{key}" if path else key
+            else:
+                current_path = f"{frames[-1][1]}[{frames[-1][2]}]"
+                frames[-1][2] += 1
+            
+            if event == 'string' and key is not None:
+                # Vérifier si c'est un champ de date
+                if DateFormatValidator._DATE_FIELD_RE.search(key):
+                    if not self.is_iso_format(value):
+                        found.append({
+                            'type': 'json_date_format',
+                            'file': file_path,
+                            'field': current_path,
+                            'violation': value,
+                            'suggested_fix': self.convert_to_iso(value),
+                            'severity': 'HIGH'
+                        })
+            elif event == 'start_map':
+                frames.append([True, current_path, None])
+            elif event == 'start_array':
+                frames.append([False, current_path, 0])
+        
+        return found
+    
     def validate_log_timestamps(self, file_path):
         """Valider les timestamps dans un fichier log"""
         violations = []
         
         try:
+            # Lecture en flux: mémoire bornée par la ligne la plus longue
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                # Chercher des timestamps au début de ligne
-                timestamp_match = re.match(r'^\[([^\]]+)\]', line.strip())
-                if timestamp_match:
-                    timestamp = timestamp_match.group(1)
-                    if not self.is_iso_format(timestamp):
-                        violations.append({
-                            'type': 'log_timestamp_format',
-                            'file': file_path,
-                            'line': line_num,
-                            'violation': timestamp,
-                            'suggested_fix': self.convert_to_iso(timestamp),
-                            'severity': 'MEDIUM'
-                        })
+                for line_num, line in enumerate(f, 1):
+                    # Chercher des timestamps au début de ligne
+                    timestamp_match = self.RE_LOG_TS.match(line)
+                    if timestamp_match:
+                        timestamp = timestamp_match.group(1)
+                        if not self.is_iso_format(timestamp):
+                            violations.append({
+                                'type': 'log_timestamp_format',
+                                'file': file_path,
+                                'line': line_num,
+                                'violation': timestamp,
+                                'suggested_fix': self.convert_to_iso(timestamp),
+                                'severity': 'MEDIUM'
+                            })
         
         except Exception as e:
             violations.append({
@@ -132,64 +282,68 @@ class DateFormatValidator:
     def is_iso_format(self, date_string):
         """Vérifier si une chaîne est au format ISO 8601"""
         try:
-            # Tentative de parsing strict ISO
-            if 'T' in date_string:
-                # Format datetime
-                return bool(re.match(
-                    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$', 
-                    date_string
-                ))
-            else:
-                # Format date seulement
-                return bool(re.match(r'^\d{4}-\d{2}-\d{2}$', date_string))
+            # Tentative de parsing strict ISO: datetime si 'T', sinon date seule
+            pattern = self._RE_ISO_DT if 'T' in date_string else self._RE_ISO_D
+            return pattern.match(date_string) is not None
         except:
             return False
     
     def convert_to_iso(self, date_string):
         """Convertir une date vers le format ISO 8601"""
-        try:
-            # Tentative de parsing avec dateutil
-            parsed_date = dateutil.parser.parse(date_string)
-            
-            # Si pas de timezone, ajouter UTC
-            if parsed_date.tzinfo is None:
-                parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-            
-            return parsed_date.isoformat()
-        except:
+        iso = _parse_to_iso(date_string)
+        if iso is None:
             # Si la conversion échoue, retourner la date actuelle ISO
             return datetime.now(timezone.utc).isoformat()
+        return iso
     
-    def scan_workspace(self, workspace_path="."):
-        """Scanner tout le workspace pour les violations de format de date"""
+    def scan_workspace(self, workspace_path=".", max_workers=1):
+        """Scanner tout le workspace pour les violations de format de date
+        
+        Exécution séquentielle par défaut; avec max_workers > 1, le contenu
+        des fichiers JSON et log est validé sur un ProcessPoolExecutor.
+        L'ordre des violations reste celui des fichiers.
+        """
         print("🔍 SCAN COPILOTAGE - VALIDATION DATES ISO 8601")
         print("=" * 60)
         
         all_violations = []
         
-        # Scanner les fichiers JSON
-        json_files = glob.glob(os.path.join(workspace_path, "**/*.json"), recursive=True)
-        print(f"📄 Scan {len(json_files)} fichiers JSON...")
+        # Un seul parcours du workspace, répartition par extension
+        json_files = []
+        log_files = []
+        py_files = []
+        by_suffix = {'.json': json_files, '.log': log_files, '.py': py_files}
+        for entry in _iter_workspace_files(workspace_path):
+            bucket = by_suffix.get(os.path.splitext(entry.name)[1])
+            if bucket is not None:
+                bucket.append(entry.path)
         
-        for json_file in json_files:
-            # Valider nom de fichier
-            filename_violations = self.validate_filename(json_file)
-            all_violations.extend(filename_violations)
+        with ExitStack() as stack:
+            if max_workers > 1 and len(json_files) + len(log_files) > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+                validate_all = partial(executor.map, chunksize=4)
+            else:
+                validate_all = map
             
-            # Valider contenu JSON
-            json_violations = self.validate_json_dates(json_file)
-            all_violations.extend(json_violations)
-        
-        # Scanner les fichiers log
-        log_files = glob.glob(os.path.join(workspace_path, "**/*.log"), recursive=True)
-        print(f"📝 Scan {len(log_files)} fichiers log...")
-        
-        for log_file in log_files:
-            log_violations = self.validate_log_timestamps(log_file)
-            all_violations.extend(log_violations)
+            # Scanner les fichiers JSON
+            print(f"📄 Scan {len(json_files)} fichiers JSON...")
+            
+            json_results = validate_all(self.validate_json_dates, json_files)
+            for json_file, json_violations in zip(json_files, json_results):
+                # Valider nom de fichier
+                filename_violations = self.validate_filename(json_file)
+                all_violations.extend(filename_violations)
+                
+                # Valider contenu JSON
+                all_violations.extend(json_violations)
+            
+            # Scanner les fichiers log
+            print(f"📝 Scan {len(log_files)} fichiers log...")
+            
+            for log_violations in validate_all(self.validate_log_timestamps, log_files):
+                all_violations.extend(log_violations)
         
         # Scanner les fichiers Python pour les dates hardcodées
-        py_files = glob.glob(os.path.join(workspace_path, "**/*.py"), recursive=True)
         print(f"🐍 Scan {len(py_files)} fichiers Python...")
         
         for py_file in py_files:
@@ -218,8 +372,8 @@ class DateFormatValidator:
         
         # Sauvegarder le rapport
         report_file = f"copilotage_date_compliance_{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H-%M-%SZ')}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_file, 'wb') as f:
+            f.write(dumps_json(report))
         
         return report, report_file
 
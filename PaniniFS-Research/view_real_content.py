@@ -8,167 +8,217 @@ pas juste les noms de fichiers.
 """
 
 import json
+import os
 import re
-from pathlib import Path
+import sys
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-def show_dhatu_details():
-    """Afficher les détails concrets des dhātu trouvés"""
-    
-    # Lire le contenu extrait
-    try:
-        with open('extracted_content.json', 'r') as f:
-            content_data = json.load(f)
-    except:
-        print("❌ Fichier extracted_content.json non trouvé")
-        return
-    
-    print("🔬 DÉTAILS DHĀTU EN COURS D'ÉTUDE:")
-    print("=" * 50)
-    
-    dhatu_found = False
-    
-    for filename, data in content_data.items():
-        if data['dhatu_mentions']:
-            print(f"\n📄 {filename}")
-            for mention in data['dhatu_mentions']:
-                print(f"   🔸 {mention}")
-            dhatu_found = True
-    
-    if not dhatu_found:
-        print("   ℹ️ Pas de mentions dhātu spécifiques dans les fichiers récents")
-    
-    print("\n" + "=" * 50)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def show_theory_details():
-    """Afficher les détails des théories en développement"""
-    
-    try:
-        with open('extracted_content.json', 'r') as f:
-            content_data = json.load(f)
-    except:
-        return
-    
-    print("\n🧠 THÉORIES EN DÉVELOPPEMENT:")
-    print("=" * 50)
-    
-    for filename, data in content_data.items():
-        if data['docstrings']:
-            print(f"\n📚 {filename}")
-            
-            for i, docstring in enumerate(data['docstrings'][:2]):  # Max 2 par fichier
-                print(f"\n   📝 Théorie {i+1}:")
-                
-                # Nettoyer et formatter la docstring
-                clean_doc = clean_docstring(docstring)
-                if len(clean_doc) > 100:
-                    print(f"   {clean_doc}")
-                    
-                    # Extraire concepts clés
-                    concepts = extract_key_concepts(clean_doc)
-                    if concepts:
-                        print(f"   🔑 Concepts: {', '.join(concepts[:5])}")
-
-
-def show_class_details():
-    """Afficher les détails des classes définies"""
+# Au-delà de cette taille, lecture enregistrement par enregistrement (ijson)
+STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+# Erreurs de lecture/parsing du contenu extrait (orjson.JSONDecodeError
+# dérive de json.JSONDecodeError; UnicodeDecodeError: octets non UTF-8)
+_READ_ERRORS = (OSError, json.JSONDecodeError, UnicodeDecodeError) + (
+    (ijson.JSONError,) if ijson is not None else ()
+)
+
+
+class ContentReadError(Exception):
+    """Lecture ou parsing du contenu extrait impossible"""
+
+
+# Concepts théoriques: union des patterns, compilée une fois
+# (chaque mot commence par un seul préfixe: mêmes correspondances)
+_CONCEPT_RE = re.compile(
+    r'\b(semantic\w*|universal\w*|panini\w*|information\w*|theory\w*'
+    r'|théorie\w*|foundation\w*|fondement\w*|composition\w*|fractal\w*'
+    r'|mapping\w*|domain\w*|autonomous\w*|autonome\w*)\b',
+    re.IGNORECASE
+)
+
+
+# Mots-clés par thème de recherche (minuscules, construits une seule fois)
+_SEMANTIC_WORDS = ('semantic', 'universal', 'fondement')
+_AUTONOMOUS_WORDS = ('autonome', 'autonomous', 'apprentissage')
+_INFORMATION_WORDS = ('information', 'theory', 'théorie')
+_DHATU_WORDS = ('dhatu', 'dhātu', 'linguist')
+_INFRASTRUCTURE_WORDS = ('github', 'renommeur', 'dashboard')
+
+
+def load_content(path='extracted_content.json'):
+    """Charger le contenu extrait une seule fois (orjson si disponible)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def iter_content(path='extracted_content.json', size=None):
+    """Itérer sur les paires (fichier, données) du contenu extrait
     
+    Au-delà de STREAMING_THRESHOLD_BYTES et si ijson est disponible, les
+    enregistrements sont lus un à un sans construire tout le document.
+    `size` évite un second stat quand l'appelant connaît déjà la taille.
+    Seules les erreurs de lecture/parsing deviennent ContentReadError; les
+    erreurs du code qui consomme les paires ne passent pas par ici.
+    """
     try:
-        with open('extracted_content.json', 'r') as f:
-            content_data = json.load(f)
-    except:
-        return
+        if size is None:
+            size = os.path.getsize(path)
+        if ijson is not None and size > STREAMING_THRESHOLD_BYTES:
+            with open(path, 'rb') as f:
+                yield from ijson.kvitems(f, '')
+            return
+        
+        content_data = load_content(path)
+    except _READ_ERRORS as e:
+        raise ContentReadError(f"{path}: {e}") from e
     
-    print("\n📚 CLASSES ET STRUCTURES DÉFINIES:")
-    print("=" * 50)
+    yield from content_data.items()
+
+
+def write_dhatu_details(out, filename, mentions):
+    """Écrire les détails concrets des dhātu trouvés pour un fichier"""
+    append = out.append
+    append(f"\n📄 {filename}")
+    for mention in mentions:
+        append(f"   🔸 {mention}")
+
+
+def write_theory_details(out, filename, docstrings):
+    """Écrire les détails des théories en développement pour un fichier"""
+    out.append(f"\n📚 {filename}")
     
-    for filename, data in content_data.items():
-        if data['class_definitions']:
-            print(f"\n🏗️ {filename}")
+    for i, docstring in enumerate(docstrings[:2]):  # Max 2 par fichier
+        out.append(f"\n   📝 Théorie {i+1}:")
+        
+        # Le nettoyage ne fait que retirer des caractères: une docstring
+        # brute de 100 caractères ou moins ne peut pas être affichée
+        if len(docstring) <= 100:
+            continue
+        
+        # Nettoyer et formatter la docstring
+        clean_doc = clean_docstring(docstring)
+        if len(clean_doc) > 100:
+            out.append(f"   {clean_doc}")
             
-            for class_def in data['class_definitions']:
-                print(f"   📦 {class_def['name']}")
-                if class_def['docstring']:
-                    print(f"      → {class_def['docstring']}")
+            # Extraire concepts clés
+            concepts = extract_key_concepts(clean_doc)
+            if concepts:
+                out.append(f"   🔑 Concepts: {', '.join(concepts[:5])}")
 
 
-def show_data_structures():
-    """Afficher les structures de données trouvées"""
-    
-    try:
-        with open('extracted_content.json', 'r') as f:
-            content_data = json.load(f)
-    except:
-        return
+def write_class_details(out, filename, class_definitions):
+    """Écrire les détails des classes définies pour un fichier"""
+    append = out.append
+    append(f"\n🏗️ {filename}")
     
-    print("\n🗃️ STRUCTURES DE DONNÉES:")
-    print("=" * 50)
+    for class_def in class_definitions:
+        append(f"   📦 {class_def['name']}")
+        class_doc = class_def['docstring']
+        if class_doc:
+            append(f"      → {class_doc}")
+
+
+def write_data_structures(out, filename, data_structures):
+    """Écrire les structures de données trouvées pour un fichier"""
+    out.append(f"\n💾 {filename}")
     
-    for filename, data in content_data.items():
-        if data['data_structures']:
-            print(f"\n💾 {filename}")
-            
-            for struct in data['data_structures'][:3]:  # Max 3 par fichier
-                # Nettoyer la structure
-                clean_struct = ' '.join(struct.split())
-                if len(clean_struct) > 50:
-                    print(f"   🔹 {clean_struct[:120]}...")
+    for struct in data_structures[:3]:  # Max 3 par fichier
+        # Nettoyer la structure: seuls 120 caractères sont affichés, on
+        # nettoie d'abord un préfixe (repli sur le tout s'il est trop court)
+        clean_struct = ' '.join(struct[:400].split())
+        if len(clean_struct) < 120 and len(struct) > 400:
+            clean_struct = ' '.join(struct.split())
+        if len(clean_struct) > 50:
+            out.append(f"   🔹 {clean_struct[:120]}...")
 
 
 def clean_docstring(docstring):
     """Nettoyer une docstring pour affichage"""
-    # Enlever les caractères spéciaux de formatage
-    clean = re.sub(r'[=]+', '', docstring)
-    clean = re.sub(r'[-]+', '', clean)
-    clean = re.sub(r'\n+', ' ', clean)
-    clean = re.sub(r'\s+', ' ', clean)
-    return clean.strip()
+    # Pas de lru_cache: les docstrings extraites sont quasi toutes distinctes
+    # (0 doublon sur le contenu réel) et le hachage + la gestion du cache
+    # coûtent plus que le nettoyage tant que les doublons restent sous ~10%
+    # Enlever les caractères spéciaux de formatage, puis normaliser les
+    # blancs (split() couvre \n et \s, et enlève ceux des extrémités)
+    clean = docstring.replace('=', '').replace('-', '')
+    return ' '.join(clean.split())
 
 
 def extract_key_concepts(text):
     """Extraire les concepts clés d'un texte"""
-    # Mots-clés théoriques importants
-    concepts = []
-    
-    # Patterns pour concepts
-    patterns = [
-        r'\b(semantic\w*)\b',
-        r'\b(universal\w*)\b',
-        r'\b(panini\w*)\b',
-        r'\b(information\w*)\b',
-        r'\b(theory\w*)\b',
-        r'\b(théorie\w*)\b',
-        r'\b(foundation\w*)\b',
-        r'\b(fondement\w*)\b',
-        r'\b(composition\w*)\b',
-        r'\b(fractal\w*)\b',
-        r'\b(mapping\w*)\b',
-        r'\b(domain\w*)\b',
-        r'\b(autonomous\w*)\b',
-        r'\b(autonome\w*)\b'
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        concepts.extend(matches)
-    
-    # Enlever doublons et retourner
-    return list(set(concepts))
-
-
-def show_active_research_focus():
-    """Identifier le focus de recherche actuel"""
+    # Un seul balayage pour tous les mots-clés théoriques importants
+    concepts = _CONCEPT_RE.findall(text)
     
-    try:
-        with open('extracted_content.json', 'r') as f:
-            content_data = json.load(f)
-    except:
-        return
+    # Enlever doublons en gardant l'ordre d'apparition (sortie déterministe)
+    return list(dict.fromkeys(concepts))
+
+
+def classify_research_focus(filename, docstrings, themes, theme_files):
+    """Compter un fichier dans les thèmes de recherche qu'il mentionne"""
+    all_text = ' '.join(docstrings).lower()
+    
+    # Classifier par thème (tests `in` en C: plus rapides ici qu'un
+    # automate Aho-Corasick, une alternation en un seul passage ou un
+    # ensemble de mots; ce dernier perdrait aussi les correspondances
+    # partielles voulues, p. ex. 'linguist' dans 'linguistique')
+    if any(word in all_text for word in _SEMANTIC_WORDS):
+        themes['Sémantique/Universal'] += 1
+        theme_files['Sémantique/Universal'].append(filename)
+    
+    if any(word in all_text for word in _AUTONOMOUS_WORDS):
+        themes['Systèmes Autonomes'] += 1
+        theme_files['Systèmes Autonomes'].append(filename)
+    
+    if any(word in all_text for word in _INFORMATION_WORDS):
+        themes['Théorie Information'] += 1
+        theme_files['Théorie Information'].append(filename)
+    
+    if any(word in all_text for word in _DHATU_WORDS):
+        themes['Dhātu/Linguistique'] += 1
+        theme_files['Dhātu/Linguistique'].append(filename)
+    
+    filename_lower = filename.lower()
+    if any(word in filename_lower for word in _INFRASTRUCTURE_WORDS):
+        themes['Infrastructure/Tech'] += 1
+        theme_files['Infrastructure/Tech'].append(filename)
+
+
+def write_research_focus(out, themes, theme_files):
+    """Écrire le focus de recherche actuel à partir des comptes par thème"""
+    out.append("\n🎯 FOCUS DE RECHERCHE ACTUEL:")
+    out.append("=" * 50)
     
-    print("\n🎯 FOCUS DE RECHERCHE ACTUEL:")
-    print("=" * 50)
+    # Afficher résultats
+    for theme, count in sorted(themes.items(), key=lambda x: x[1], reverse=True):
+        if count > 0:
+            out.append(f"\n🔸 {theme}: {count} fichier(s)")
+            for filename in theme_files[theme][:3]:  # Max 3 exemples
+                out.append(f"   • {filename}")
     
+    # Identifier focus principal
+    main_focus = max(themes.items(), key=lambda x: x[1])
+    if main_focus[1] > 0:
+        out.append(f"\n🎯 FOCUS PRINCIPAL: {main_focus[0]} ({main_focus[1]} fichiers)")
+
+
+def render_sections(records):
+    """Rendre toutes les sections en un seul parcours des paires (fichier, données)
+    
+    Chaque section accumule ses lignes dans sa propre liste; les listes
+    sont assemblées ensuite dans l'ordre d'affichage d'origine.
+    """
     # Compter les mentions par thème
     themes = {
         'Sémantique/Universal': 0,
@@ -177,45 +227,54 @@ def show_active_research_focus():
         'Dhātu/Linguistique': 0,
         'Infrastructure/Tech': 0
     }
-    
     theme_files = {key: [] for key in themes.keys()}
     
-    for filename, data in content_data.items():
-        filename_lower = filename.lower()
-        all_text = ' '.join(data['docstrings']).lower()
-        
-        # Classifier par thème
-        if any(word in all_text for word in ['semantic', 'universal', 'fondement']):
-            themes['Sémantique/Universal'] += 1
-            theme_files['Sémantique/Universal'].append(filename)
+    focus_lines = []
+    theory_lines = []
+    class_lines = []
+    dhatu_lines = []
+    struct_lines = []
+    
+    theory_lines.append("\n🧠 THÉORIES EN DÉVELOPPEMENT:")
+    theory_lines.append("=" * 50)
+    class_lines.append("\n📚 CLASSES ET STRUCTURES DÉFINIES:")
+    class_lines.append("=" * 50)
+    dhatu_lines.append("🔬 DÉTAILS DHĀTU EN COURS D'ÉTUDE:")
+    dhatu_lines.append("=" * 50)
+    struct_lines.append("\n🗃️ STRUCTURES DE DONNÉES:")
+    struct_lines.append("=" * 50)
+    
+    dhatu_found = False
+    
+    for filename, data in records:
+        docstrings = data['docstrings']
+        classify_research_focus(filename, docstrings, themes, theme_files)
         
-        if any(word in all_text for word in ['autonome', 'autonomous', 'apprentissage']):
-            themes['Systèmes Autonomes'] += 1
-            theme_files['Systèmes Autonomes'].append(filename)
+        if docstrings:
+            write_theory_details(theory_lines, filename, docstrings)
         
-        if any(word in all_text for word in ['information', 'theory', 'théorie']):
-            themes['Théorie Information'] += 1
-            theme_files['Théorie Information'].append(filename)
+        class_definitions = data['class_definitions']
+        if class_definitions:
+            write_class_details(class_lines, filename, class_definitions)
         
-        if any(word in all_text for word in ['dhatu', 'dhātu', 'linguist']):
-            themes['Dhātu/Linguistique'] += 1
-            theme_files['Dhātu/Linguistique'].append(filename)
+        mentions = data['dhatu_mentions']
+        if mentions:
+            write_dhatu_details(dhatu_lines, filename, mentions)
+            dhatu_found = True
         
-        if any(word in filename_lower for word in ['github', 'renommeur', 'dashboard']):
-            themes['Infrastructure/Tech'] += 1
-            theme_files['Infrastructure/Tech'].append(filename)
+        data_structures = data['data_structures']
+        if data_structures:
+            write_data_structures(struct_lines, filename, data_structures)
     
-    # Afficher résultats
-    for theme, count in sorted(themes.items(), key=lambda x: x[1], reverse=True):
-        if count > 0:
-            print(f"\n🔸 {theme}: {count} fichier(s)")
-            for filename in theme_files[theme][:3]:  # Max 3 exemples
-                print(f"   • {filename}")
+    if not dhatu_found:
+        dhatu_lines.append("   ℹ️ Pas de mentions dhātu spécifiques dans les fichiers récents")
     
-    # Identifier focus principal
-    main_focus = max(themes.items(), key=lambda x: x[1])
-    if main_focus[1] > 0:
-        print(f"\n🎯 FOCUS PRINCIPAL: {main_focus[0]} ({main_focus[1]} fichiers)")
+    dhatu_lines.append("\n" + "=" * 50)
+    
+    write_research_focus(focus_lines, themes, theme_files)
+    
+    lines = focus_lines + theory_lines + class_lines + dhatu_lines + struct_lines
+    return '\n'.join(lines) + '\n'
 
 
 def main():
@@ -223,18 +282,23 @@ def main():
     print("📖 VISUALISEUR CONTENU PANINI - DÉTAILS RÉELS")
     print("=" * 60)
     
-    # Vérifier si le fichier d'extraction existe
-    if not Path('extracted_content.json').exists():
+    # Vérifier si le fichier d'extraction existe (un seul stat, taille réutilisée)
+    try:
+        size = os.stat('extracted_content.json').st_size
+    except OSError:
         print("\n⚠️ Extraction du contenu requise...")
         print("📝 Exécutez d'abord: python3 extract_direct_content.py")
         return
     
-    # Afficher les différentes sections
-    show_active_research_focus()
-    show_theory_details()
-    show_class_details() 
-    show_dhatu_details()
-    show_data_structures()
+    # Lire le contenu extrait en un seul parcours pour toutes les sections
+    # (rendu en mémoire: une erreur de lecture n'affiche aucune section)
+    try:
+        sections = render_sections(iter_content(size=size))
+    except ContentReadError:
+        print("❌ Fichier extracted_content.json non trouvé")
+        return
+    
+    sys.stdout.write(sections)
     
     print("\n" + "=" * 60)
     print("✅ Visualisation contenu terminée")